@@ -287,3 +287,48 @@ class TestExchangeRateRevaluation(AccountsTestMixin, IntegrationTestCase):
 
 		for key, _val in expected_data.items():
 			self.assertEqual(expected_data.get(key), account_details.get(key))
+
+	@IntegrationTestCase.change_settings(
+		"Accounts Settings",
+		{"allow_multi_currency_invoices_against_single_party_account": 1, "allow_stale": 0},
+	)
+	def test_05_auto_create_monthly_revaluation(self):
+		"""
+		Test that the monthly background job picks up companies set to 'Monthly' frequency
+		"""
+		from erpnext.accounts.utils import (
+			auto_create_exchange_rate_revaluation_daily,
+			auto_create_exchange_rate_revaluation_monthly,
+			auto_create_exchange_rate_revaluation_weekly,
+		)
+
+		si = create_sales_invoice(
+			item=self.item,
+			company=self.company,
+			customer=self.customer,
+			debit_to=self.debtors_usd,
+			posting_date=today(),
+			parent_cost_center=self.cost_center,
+			cost_center=self.cost_center,
+			rate=100,
+			price_list_rate=100,
+			do_not_submit=1,
+		)
+		si.currency = "USD"
+		si.conversion_rate = 80
+		si.save().submit()
+
+		frappe.db.set_value(
+			"Company",
+			self.company,
+			{"auto_exchange_rate_revaluation": 1, "auto_err_frequency": "Monthly", "submit_err_jv": 0},
+		)
+
+		auto_create_exchange_rate_revaluation_daily()
+		auto_create_exchange_rate_revaluation_weekly()
+		self.assertFalse(frappe.db.exists("Exchange Rate Revaluation", {"company": self.company}))
+
+		auto_create_exchange_rate_revaluation_monthly()
+		self.assertTrue(
+			frappe.db.exists("Exchange Rate Revaluation", {"company": self.company, "docstatus": 1})
+		)
@@ -209,7 +209,7 @@ class Appointment(Document):
 		employee = _get_employee_from_user(self._assign)
 		if employee:
 			appointment_event.append(
-				"event_participants", dict(reference_doctype="Employee", reference_docname=employee.name)
+				"event_participants", dict(reference_doctype="Employee", reference_docname=employee)
 			)
 		appointment_event.insert(ignore_permissions=True)
 		self.calendar_event = appointment_event.name
@@ -228,16 +228,18 @@ class Appointment(Document):
 
 
 def _get_agents_sorted_by_asc_workload(date):
-	appointments = frappe.get_all("Appointment", fields="*")
 	agent_list = _get_agent_list_as_strings()
-	if not appointments:
-		return agent_list
+	if not agent_list:
+		return []
+	appointments = frappe.get_all(
+		"Appointment", fields=["_assign"], filters={"scheduled_time": ("between", [date, date])}
+	)
 	appointment_counter = Counter(agent_list)
 	for appointment in appointments:
 		assigned_to = frappe.parse_json(appointment._assign)
 		if not assigned_to:
 			continue
-		if (assigned_to[0] in agent_list) and getdate(appointment.scheduled_time) == date:
+		if assigned_to[0] in appointment_counter:
 			appointment_counter[assigned_to[0]] += 1
 	sorted_agent_list = appointment_counter.most_common()
 	sorted_agent_list.reverse()
@@ -246,7 +248,7 @@ def _get_agents_sorted_by_asc_workload(date):
 
 def _get_agent_list_as_strings():
 	agent_list_as_strings = []
-	agent_list = frappe.get_doc("Appointment Booking Settings").agent_list
+	agent_list = frappe.get_cached_doc("Appointment Booking Settings").agent_list
 	for agent in agent_list:
 		agent_list_as_strings.append(agent.user)
 	return agent_list_as_strings
@@ -261,7 +263,4 @@ def _check_agent_availability(agent_email, scheduled_time):
 
 
 def _get_employee_from_user(user):
-	employee_docname = frappe.db.get_value("Employee", {"user_id": user})
-	if employee_docname:
-		return frappe.get_doc("Employee", employee_docname)
-	return None
+	return frappe.db.get_value("Employee", {"user_id": user})
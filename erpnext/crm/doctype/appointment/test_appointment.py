@@ -5,11 +5,15 @@ import unittest
 
 import frappe
 from frappe.tests import IntegrationTestCase
+from frappe.utils import add_days, getdate, now_datetime
+
+from erpnext.crm.doctype.appointment.appointment import _get_agents_sorted_by_asc_workload
 
 LEAD_EMAIL = "test_appointment_lead@example.com"
+AGENTS = ["test_appointment_agent_1@example.com", "test_appointment_agent_2@example.com"]
 
 
-def create_test_appointment():
+def create_test_appointment(scheduled_time=None):
 	test_appointment = frappe.get_doc(
 		{
 			"doctype": "Appointment",
@@ -18,7 +22,7 @@ def create_test_appointment():
 			"customer_phone_number": "666",
 			"customer_skype": "test",
 			"customer_email": LEAD_EMAIL,
-			"scheduled_time": datetime.datetime.now(),
+			"scheduled_time": scheduled_time or datetime.datetime.now(),
 			"customer_details": "Hello, Friend!",
 		}
 	)
@@ -42,3 +46,45 @@ class TestAppointment(IntegrationTestCase):
 
 	def test_lead_linked(self):
 		self.assertTrue(self.test_appointment.party)
+
+	def test_agent_workload_counts_only_same_day(self):
+		set_agents(AGENTS)
+		day = getdate(add_days(now_datetime(), 60))
+		next_day = add_days(day, 1)
+
+		for agent, scheduled_time in (
+			(AGENTS[0], datetime.datetime.combine(day, datetime.time(10))),
+			(AGENTS[0], datetime.datetime.combine(day, datetime.time(23, 59))),
+			(AGENTS[1], datetime.datetime.combine(day, datetime.time(12))),
+			(AGENTS[1], datetime.datetime.combine(next_day, datetime.time(0, 0, 30))),
+			(AGENTS[1], datetime.datetime.combine(next_day, datetime.time(10))),
+		):
+			appointment = create_test_appointment(scheduled_time)
+			frappe.db.set_value(
+				"Appointment", appointment.name, "_assign", frappe.as_json([agent]), update_modified=False
+			)
+
+		# every agent starts with a count of 1
+		self.assertEqual(dict(_get_agents_sorted_by_asc_workload(day)), {AGENTS[0]: 3, AGENTS[1]: 2})
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+
+def set_agents(agents):
+	for agent in agents:
+		if not frappe.db.exists("User", agent):
+			frappe.get_doc(
+				{
+					"doctype": "User",
+					"email": agent,
+					"first_name": agent,
+					"send_welcome_email": 0,
+					"roles": [{"doctype": "Has Role", "role": "System Manager"}],
+				}
+			).insert()
+
+	settings = frappe.get_doc("Appointment Booking Settings")
+	settings.set("agent_list", [{"user": agent} for agent in agents])
+	settings.flags.ignore_mandatory = True
+	settings.save()
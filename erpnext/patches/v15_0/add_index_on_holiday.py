@@ -0,0 +1,5 @@
+import frappe
+
+
+def execute():
+	frappe.get_doc("DocType", "Holiday").run_module_method("on_doctype_update")
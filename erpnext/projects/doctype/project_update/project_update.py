@@ -31,30 +31,38 @@ class ProjectUpdate(Document):
 
 @frappe.whitelist()
 def daily_reminder():
+	# no summaries are sent on holidays, skip the per-project queries altogether
+	if frappe.db.sql("""SELECT holiday_date FROM `tabHoliday` where holiday_date = CURRENT_DATE;"""):
+		return
+
 	project = frappe.db.sql(
-		"""SELECT `tabProject`.project_name,`tabProject`.frequency,`tabProject`.expected_start_date,`tabProject`.expected_end_date,`tabProject`.percent_complete FROM `tabProject`;"""
+		"""SELECT `tabProject`.name,`tabProject`.project_name,`tabProject`.frequency,`tabProject`.expected_start_date,`tabProject`.expected_end_date,`tabProject`.percent_complete FROM `tabProject`;"""
 	)
 	for projects in project:
-		project_name = projects[0]
-		frequency = projects[1]
-		date_start = projects[2]
-		date_end = projects[3]
-		progress = projects[4]
+		project_id = projects[0]
+		project_name = projects[1]
+		frequency = projects[2]
+		date_start = projects[3]
+		date_end = projects[4]
+		progress = projects[5]
 		draft = frappe.db.sql(
 			"""SELECT count(docstatus) from `tabProject Update` WHERE `tabProject Update`.project = %s AND `tabProject Update`.docstatus = 0;""",
-			project_name,
+			project_id,
 		)
 		for drafts in draft:
 			number_of_drafts = drafts[0]
 		update = frappe.db.sql(
 			"""SELECT name,date,time,progress,progress_details FROM `tabProject Update` WHERE `tabProject Update`.project = %s AND date = DATE_ADD(CURRENT_DATE, INTERVAL -1 DAY);""",
-			project_name,
+			project_id,
+		)
+		email_sending(
+			project_id, project_name, frequency, date_start, date_end, progress, number_of_drafts, update
 		)
-		email_sending(project_name, frequency, date_start, date_end, progress, number_of_drafts, update)
 
 
-def email_sending(project_name, frequency, date_start, date_end, progress, number_of_drafts, update):
-	holiday = frappe.db.sql("""SELECT holiday_date FROM `tabHoliday` where holiday_date = CURRENT_DATE;""")
+def email_sending(
+	project_id, project_name, frequency, date_start, date_end, progress, number_of_drafts, update
+):
 	msg = (
 		"<p>Project Name: "
 		+ project_name
@@ -98,9 +106,8 @@ def email_sending(project_name, frequency, date_start, date_end, progress, numbe
 		)
 
 	msg += "</table>"
-	if len(holiday) == 0:
-		email = frappe.db.sql("""SELECT user from `tabProject User` WHERE parent = %s;""", project_name)
-		for emails in email:
-			frappe.sendmail(recipients=emails, subject=frappe._(project_name + " " + "Summary"), message=msg)
-	else:
-		pass
+	email = frappe.db.sql("""SELECT user from `tabProject User` WHERE parent = %s;""", project_id)
+	recipients = [emails[0] for emails in email]
+	if recipients:
+		# single Email Queue entry for all users, each recipient still gets a separate mail
+		frappe.sendmail(recipients=recipients, subject=frappe._(project_name + " " + "Summary"), message=msg)
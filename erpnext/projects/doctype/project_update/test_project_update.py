@@ -4,10 +4,64 @@ import unittest
 
 import frappe
 from frappe.tests import IntegrationTestCase
+from frappe.utils import add_days, today
+
+from erpnext.projects.doctype.project.test_project import make_project
+from erpnext.projects.doctype.project_update.project_update import daily_reminder, email_sending
+
+PROJECT_USERS = ["test_project_update_1@example.com", "test_project_update_2@example.com"]
 
 
 class TestProjectUpdate(IntegrationTestCase):
-	pass
+	def setUp(self):
+		self.project = make_project_with_users(PROJECT_USERS)
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_no_summary_sent_on_holiday(self):
+		frappe.get_doc(
+			{
+				"doctype": "Holiday List",
+				"holiday_list_name": "_Test Project Update Holiday List",
+				"from_date": add_days(today(), -1),
+				"to_date": add_days(today(), 1),
+				"holidays": [{"holiday_date": today(), "description": "Test Holiday"}],
+			}
+		).insert()
+
+		email_queue_count = frappe.db.count("Email Queue")
+		daily_reminder()
+		self.assertEqual(frappe.db.count("Email Queue"), email_queue_count)
+
+	def test_summary_queued_once_for_all_users(self):
+		existing_queue = set(frappe.get_all("Email Queue", pluck="name"))
+		email_sending(self.project.name, self.project.project_name, "Daily", today(), today(), 0, 0, [])
+
+		new_queue = [
+			name for name in frappe.get_all("Email Queue", pluck="name") if name not in existing_queue
+		]
+		self.assertEqual(len(new_queue), 1)
+
+		recipients = frappe.get_all(
+			"Email Queue Recipient", filters={"parent": new_queue[0]}, pluck="recipient"
+		)
+		self.assertCountEqual(recipients, PROJECT_USERS)
+
+
+def make_project_with_users(users):
+	for user in users:
+		if not frappe.db.exists("User", user):
+			frappe.get_doc(
+				{"doctype": "User", "email": user, "first_name": user, "send_welcome_email": 0}
+			).insert()
+
+	project = make_project({"project_name": "_Test Project Update"})
+	project.frequency = "Daily"
+	project.set("users", [{"user": user} for user in users])
+	project.save()
+
+	return project
 
 
 IGNORE_TEST_RECORD_DEPENDENCIES = ["Sales Order"]
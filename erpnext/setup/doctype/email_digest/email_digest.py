@@ -107,26 +107,35 @@ class EmailDigest(Document):
 	@frappe.whitelist()
 	def send(self):
 		# send email only to enabled users
-		valid_users = [
+		valid_users = {
 			p[0]
 			for p in frappe.db.sql(
 				"""select name from `tabUser`
 			where enabled=1"""
 			)
-		]
+		}
 
-		if self.recipients:
-			for row in self.recipients:
-				msg_for_this_recipient = self.get_msg_html()
-				if msg_for_this_recipient and row.recipient in valid_users:
-					frappe.sendmail(
-						recipients=row.recipient,
-						subject=_("{0} Digest").format(_(self.frequency)),
-						message=msg_for_this_recipient,
-						reference_doctype=self.doctype,
-						reference_name=self.name,
-						unsubscribe_message=_("Unsubscribe from this Email Digest"),
-					)
+		recipients = [row.recipient for row in self.recipients if row.recipient in valid_users]
+		if not recipients:
+			return
+
+		# the digest, subject and unsubscribe message are the same for every recipient
+		msg = self.get_msg_html()
+		if not msg:
+			return
+
+		subject = _("{0} Digest").format(_(self.frequency))
+		unsubscribe_message = _("Unsubscribe from this Email Digest")
+
+		for recipient in recipients:
+			frappe.sendmail(
+				recipients=recipient,
+				subject=subject,
+				message=msg,
+				reference_doctype=self.doctype,
+				reference_name=self.name,
+				unsubscribe_message=unsubscribe_message,
+			)
 
 	def get_msg_html(self):
 		"""Build email digest content"""
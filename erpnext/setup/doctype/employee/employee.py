@@ -9,6 +9,7 @@ from frappe.permissions import (
 	has_permission,
 	remove_user_permission,
 )
+from frappe.query_builder.functions import Coalesce, NullIf
 from frappe.utils import cstr, getdate, today, validate_email_address
 from frappe.utils.nestedset import NestedSet
 
@@ -361,35 +362,34 @@ def create_user(employee, user=None, email=None):
 
 def get_all_employee_emails(company):
 	"""Returns list of employee emails either based on user_id or company_email"""
-	employee_list = frappe.get_all(
-		"Employee", fields=["name", "employee_name"], filters={"status": "Active", "company": company}
-	)
-	employee_emails = []
-	for employee in employee_list:
-		if not employee:
-			continue
-		user, company_email, personal_email = frappe.db.get_value(
-			"Employee", employee, ["user_id", "company_email", "personal_email"]
-		)
-		email = user or company_email or personal_email
-		if email:
-			employee_emails.append(email)
-	return employee_emails
+	employee = frappe.qb.DocType("Employee")
+	email_map = _get_employee_email_map((employee.status == "Active") & (employee.company == company))
+
+	return list(email_map.values())
 
 
 def get_employee_emails(employee_list):
 	"""Returns list of employee emails either based on user_id or company_email"""
-	employee_emails = []
-	for employee in employee_list:
-		if not employee:
-			continue
-		user, company_email, personal_email = frappe.db.get_value(
-			"Employee", employee, ["user_id", "company_email", "personal_email"]
-		)
-		email = user or company_email or personal_email
-		if email:
-			employee_emails.append(email)
-	return employee_emails
+	employee_list = [employee for employee in employee_list if employee]
+	if not employee_list:
+		return []
+
+	employee = frappe.qb.DocType("Employee")
+	email_map = _get_employee_email_map(employee.name.isin(employee_list))
+
+	return [email_map[name] for name in employee_list if name in email_map]
+
+
+def _get_employee_email_map(condition):
+	"""Returns employee name to preferred email map for employees matching `condition`"""
+	employee = frappe.qb.DocType("Employee")
+	email = Coalesce(
+		NullIf(employee.user_id, ""), NullIf(employee.company_email, ""), NullIf(employee.personal_email, "")
+	)
+
+	return dict(
+		frappe.qb.from_(employee).select(employee.name, email).where(condition & email.isnotnull()).run()
+	)
 
 
 @frappe.whitelist()
@@ -409,9 +409,21 @@ def get_children(doctype, parent=None, company=None, is_root=False, is_tree=Fals
 
 	employees = frappe.get_list(doctype, fields=fields, filters=filters, order_by="name")
 
+	if not employees:
+		return employees
+
+	# employees that have at least one direct report, fetched in a single query
+	managers = set(
+		frappe.get_all(
+			doctype,
+			filters=[["reports_to", "in", [employee.get("value") for employee in employees]]],
+			pluck="reports_to",
+			distinct=True,
+		)
+	)
+
 	for employee in employees:
-		is_expandable = frappe.get_all(doctype, filters=[["reports_to", "=", employee.get("value")]])
-		employee.expandable = 1 if is_expandable else 0
+		employee.expandable = 1 if employee.get("value") in managers else 0
 
 	return employees
 
@@ -7,7 +7,12 @@ import frappe.utils
 from frappe.tests import IntegrationTestCase
 
 import erpnext
-from erpnext.setup.doctype.employee.employee import InactiveEmployeeStatusError
+from erpnext.setup.doctype.employee.employee import (
+	InactiveEmployeeStatusError,
+	get_all_employee_emails,
+	get_children,
+	get_employee_emails,
+)
 
 
 class TestEmployee(IntegrationTestCase):
@@ -32,6 +37,85 @@ class TestEmployee(IntegrationTestCase):
 		employee_doc.save()
 		self.assertTrue("Employee" not in frappe.get_roles(user))
 
+	def test_get_employee_emails(self):
+		emp_with_user = make_employee("test_emp_email_user@company.com")
+		emp_with_company_email = make_employee("test_emp_email_company@company.com")
+		emp_with_personal_email = make_employee("test_emp_email_personal@company.com")
+		emp_without_email = make_employee("test_emp_email_none@company.com")
+
+		frappe.db.set_value(
+			"Employee",
+			emp_with_user,
+			{"company_email": "company_1@example.com", "personal_email": "personal_1@example.com"},
+		)
+		frappe.db.set_value(
+			"Employee",
+			emp_with_company_email,
+			{
+				"user_id": "",
+				"company_email": "company_2@example.com",
+				"personal_email": "personal_2@example.com",
+			},
+		)
+		frappe.db.set_value(
+			"Employee",
+			emp_with_personal_email,
+			{"user_id": "", "company_email": "", "personal_email": "personal_3@example.com"},
+		)
+		frappe.db.set_value(
+			"Employee", emp_without_email, {"user_id": "", "company_email": "", "personal_email": None}
+		)
+
+		emails = get_employee_emails(
+			[
+				emp_with_personal_email,
+				None,
+				emp_with_user,
+				"_Test Unknown Employee",
+				emp_with_company_email,
+				emp_without_email,
+				emp_with_user,
+				"",
+			]
+		)
+		self.assertEqual(
+			emails,
+			[
+				"personal_3@example.com",
+				"test_emp_email_user@company.com",
+				"company_2@example.com",
+				"test_emp_email_user@company.com",
+			],
+		)
+		self.assertEqual(get_employee_emails([None, ""]), [])
+
+	def test_get_all_employee_emails(self):
+		company = erpnext.get_default_company()
+		make_employee("test_emp_all_emails_active@company.com", company=company)
+		inactive = make_employee("test_emp_all_emails_inactive@company.com", company=company)
+		make_employee("test_emp_all_emails_other@company.com", company="_Test Company 1")
+		frappe.db.set_value("Employee", inactive, "status", "Inactive")
+
+		emails = get_all_employee_emails(company)
+		self.assertIn("test_emp_all_emails_active@company.com", emails)
+		self.assertNotIn("test_emp_all_emails_inactive@company.com", emails)
+		self.assertNotIn("test_emp_all_emails_other@company.com", emails)
+		self.assertIn("test_emp_all_emails_other@company.com", get_all_employee_emails("_Test Company 1"))
+
+	def test_get_children_expandable(self):
+		company = erpnext.get_default_company()
+		head = make_employee("test_emp_tree_head@company.com", company=company)
+		manager = make_employee("test_emp_tree_manager@company.com", company=company, reports_to=head)
+		leaf = make_employee("test_emp_tree_leaf@company.com", company=company, reports_to=manager)
+
+		children = get_children("Employee", parent=head, company=company)
+		self.assertEqual([(d.value, d.expandable) for d in children], [(manager, 1)])
+
+		children = get_children("Employee", parent=manager, company=company)
+		self.assertEqual([(d.value, d.expandable) for d in children], [(leaf, 0)])
+
+		self.assertEqual(get_children("Employee", parent=leaf, company=company), [])
+
 	def tearDown(self):
 		frappe.db.rollback()
 
@@ -2,6 +2,7 @@
 # License: GNU General Public License v3. See license.txt
 
 
+import frappe
 from frappe.model.document import Document
 
 
@@ -23,3 +24,7 @@ class Holiday(Document):
 	# end: auto-generated types
 
 	pass
+
+
+def on_doctype_update():
+	frappe.db.add_index("Holiday", ["parent", "holiday_date"])
@@ -50,7 +50,7 @@ class HolidayList(Document):
 		if not self.weekly_off:
 			throw(_("Please select weekly off day"))
 
-		existing_holidays = self.get_holidays()
+		existing_holidays = set(self.get_holidays())
 
 		for d in self.get_weekly_off_date_list(self.from_date, self.to_date):
 			if d in existing_holidays:
@@ -79,7 +79,7 @@ class HolidayList(Document):
 		if not self.country:
 			throw(_("Please select a country"))
 
-		existing_holidays = self.get_holidays()
+		existing_holidays = set(self.get_holidays())
 		from_date = getdate(self.from_date)
 		to_date = getdate(self.to_date)
 
@@ -108,11 +108,12 @@ class HolidayList(Document):
 		return [getdate(holiday.holiday_date) for holiday in self.holidays]
 
 	def validate_days(self):
-		if getdate(self.from_date) > getdate(self.to_date):
+		from_date, to_date = getdate(self.from_date), getdate(self.to_date)
+		if from_date > to_date:
 			throw(_("To Date cannot be before From Date"))
 
 		for day in self.get("holidays"):
-			if not (getdate(self.from_date) <= getdate(day.holiday_date) <= getdate(self.to_date)):
+			if not (from_date <= getdate(day.holiday_date) <= to_date):
 				frappe.throw(
 					_("The holiday on {0} is not between From Date and To Date").format(
 						formatdate(day.holiday_date)
@@ -128,11 +129,10 @@ class HolidayList(Document):
 		from dateutil import relativedelta
 
 		date_list = []
-		existing_date_list = []
 		weekday = getattr(calendar, (self.weekly_off).upper())
 		reference_date = start_date + relativedelta.relativedelta(weekday=weekday)
 
-		existing_date_list = [getdate(holiday.holiday_date) for holiday in self.get("holidays")]
+		existing_date_list = {getdate(holiday.holiday_date) for holiday in self.get("holidays")}
 
 		while reference_date <= end_date:
 			if reference_date not in existing_date_list:
@@ -146,7 +146,7 @@ class HolidayList(Document):
 		self.set("holidays", [])
 
 	def validate_duplicate_date(self):
-		unique_dates = []
+		unique_dates = set()
 		for row in self.holidays:
 			if row.holiday_date in unique_dates:
 				frappe.throw(
@@ -155,7 +155,7 @@ class HolidayList(Document):
 					)
 				)
 
-			unique_dates.append(row.holiday_date)
+			unique_dates.add(row.holiday_date)
 
 
 @frappe.whitelist()